@@ -9,10 +9,12 @@ from beeai_framework.errors import FrameworkError
 from beeai_framework.emitter import EmitterOptions, EventMeta
 from beeai_framework.memory import TokenMemory
 from beeai_framework.tools import AnyTool
+from src.ai_news_agent.tools import close_clients
 from src.ai_news_agent.tools.huggingface_papers import HuggingFacePapersTool
 from src.ai_news_agent.tools.huggingface_spaces import HuggingFaceSpacesTool
 from src.ai_news_agent.tools.hacker_news import HackerNewsTool
 from src.ai_news_agent.tools.arxiv import ArxivTool
+from src.ai_news_agent.tools.ai_news_digest import AINewsDigestTool
 
 
 load_dotenv()
@@ -34,11 +36,17 @@ def _create_agent():
         HuggingFaceSpacesTool(),
         HackerNewsTool(),
         ArxivTool(),
+        AINewsDigestTool(),
     ]
     agent = ReActAgent(llm=llm, tools=tools, memory=TokenMemory(llm))
     return agent
 
 
+@cl.on_app_shutdown
+async def on_app_shutdown():
+    await close_clients()
+
+
 @cl.set_starters
 async def set_starters():
     return [
@@ -58,6 +66,10 @@ async def set_starters():
             label="Recent arXiv AI Papers",
             message="What are the latest AI papers on arXiv? Include the title, brief summary and link to the paper.",
         ),
+        cl.Starter(
+            label="AI News Digest",
+            message="Give me today's AI news digest: trending papers, new arXiv papers and Hacker News stories.",
+        ),
     ]
 
 
@@ -0,0 +1,5 @@
+"""News tools and the HTTP clients they share."""
+
+from ai_news_agent.tools.http_client import close_clients, refresh_client
+
+__all__ = ["close_clients", "refresh_client"]
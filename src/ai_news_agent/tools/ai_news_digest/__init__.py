@@ -0,0 +1,8 @@
+"""AI News Digest Tool module for fetching AI/ML news from all sources at once."""
+
+from ai_news_agent.tools.ai_news_digest.digest import (
+    AINewsDigestTool,
+    AINewsDigestToolInput,
+)
+
+__all__ = ["AINewsDigestTool", "AINewsDigestToolInput"]
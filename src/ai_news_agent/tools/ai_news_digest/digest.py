@@ -0,0 +1,107 @@
+"""Tool for fetching a combined AI/ML news digest from all news sources."""
+
+import asyncio
+from typing import Any, Self
+
+from beeai_framework.context import RunContext
+from beeai_framework.emitter.emitter import Emitter
+from beeai_framework.tools import Tool, ToolError
+from beeai_framework.tools.types import JSONToolOutput, ToolRunOptions
+from pydantic import BaseModel, Field
+
+from ai_news_agent.tools.arxiv import ArxivTool
+from ai_news_agent.tools.hacker_news import HackerNewsTool
+from ai_news_agent.tools.huggingface_papers import HuggingFacePapersTool
+
+
+class AINewsDigestToolInput(BaseModel):
+    """Input schema for AI News Digest Tool."""
+
+    limit: int = Field(
+        description="Maximum number of items to fetch from each source",
+        default=5,
+        ge=1,
+        le=100,
+    )
+    query: str | None = Field(
+        description="Optional arXiv search query. If not provided, fetches recent cs.AI papers",
+        default=None,
+    )
+
+
+class AINewsDigestTool(Tool[AINewsDigestToolInput, ToolRunOptions, JSONToolOutput[dict[str, Any]]]):
+    """Fetches trending papers, arXiv papers and Hacker News stories concurrently."""
+
+    name = "AINewsDigest"
+    description = (
+        "Fetch a digest of today's AI/ML news from all sources in one step: trending "
+        "Hugging Face papers, recent arXiv cs.AI papers and AI/ML stories from Hacker News. "
+        "Use it for broad questions about the latest AI news instead of calling each source."
+    )
+    input_schema = AINewsDigestToolInput
+
+    def _create_emitter(self) -> Emitter:
+        """Creates event emitter for tool lifecycle events"""
+        return Emitter.root().child(
+            namespace=["tool", "ai_news_digest"],
+            creator=self,
+        )
+
+    @staticmethod
+    async def _fetch_digest(limit: int, query: str | None = None) -> dict[str, Any]:
+        """
+        Fetch all news sources concurrently and merge their results.
+
+        Args:
+            limit: Maximum number of items to return per source
+            query: Optional arXiv search query
+
+        Returns:
+            Dictionary with the results of each source and the errors of failed ones
+
+        Raises:
+            ToolError: If every source fails
+        """
+        # pylint: disable=protected-access
+        sources = {
+            "huggingface_papers": HuggingFacePapersTool._fetch_papers(limit),
+            "arxiv": ArxivTool._fetch_papers(limit, query),
+            "hacker_news": HackerNewsTool._fetch_ai_stories(limit),
+        }
+        # pylint: enable=protected-access
+
+        results = await asyncio.gather(*sources.values(), return_exceptions=True)
+
+        digest: dict[str, Any] = {}
+        errors: dict[str, str] = {}
+        for source, result in zip(sources, results):
+            if isinstance(result, BaseException):
+                errors[source] = str(result)
+            else:
+                digest[source] = result
+
+        if not digest:
+            raise ToolError(f"Error fetching AI news digest: {errors}")
+
+        digest["errors"] = errors
+        return digest
+
+    async def _run(  # pylint: disable=arguments-renamed
+        self,
+        input_data: AINewsDigestToolInput,
+        options: ToolRunOptions | None,
+        context: RunContext,
+    ) -> JSONToolOutput[dict[str, Any]]:
+        """Main execution method for the tool"""
+        results = await self._fetch_digest(input_data.limit, input_data.query)
+        return JSONToolOutput(results)
+
+    async def clone(self) -> Self:
+        """Creates a copy of the tool instance"""
+        tool = self.__class__(options=self.options)
+        tool.name = self.name
+        tool.description = self.description
+        tool.input_schema = self.input_schema
+        tool.middlewares.extend(self.middlewares)
+        tool._cache = await self.cache.clone()  # pylint: disable=protected-access
+        return tool
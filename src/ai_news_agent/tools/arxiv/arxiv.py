@@ -1,8 +1,5 @@
 """arXiv Tool for fetching AI research papers."""
 
-import os
-import xml.etree.ElementTree as ET
-from datetime import datetime
 from typing import Any, Self
 
 import httpx
@@ -10,8 +7,34 @@ from beeai_framework.context import RunContext
 from beeai_framework.emitter.emitter import Emitter
 from beeai_framework.tools import Tool, ToolError
 from beeai_framework.tools.types import JSONToolOutput, ToolRunOptions
+from cachetools import TTLCache
 from pydantic import BaseModel, Field
 
+from ai_news_agent.tools.http_client import get_client
+
+try:
+    from lxml import etree as ET
+except ImportError:  # pragma: no cover - fall back to the pure-Python parser
+    import xml.etree.ElementTree as ET
+
+# Namespaces and namespaced tags of the arXiv Atom feed, built once instead of per entry
+_ATOM = "{http://www.w3.org/2005/Atom}"
+_ARXIV = "{http://arxiv.org/schemas/atom}"
+_TAG_ENTRY = _ATOM + "entry"
+_TAG_ID = _ATOM + "id"
+_TAG_TITLE = _ATOM + "title"
+_TAG_SUMMARY = _ATOM + "summary"
+_TAG_PUBLISHED = _ATOM + "published"
+_TAG_UPDATED = _ATOM + "updated"
+_TAG_AUTHOR = _ATOM + "author"
+_TAG_NAME = _ATOM + "name"
+_TAG_LINK = _ATOM + "link"
+_TAG_CATEGORY = _ATOM + "category"
+_TAG_PRIMARY_CATEGORY = _ARXIV + "primary_category"
+
+# Parsed papers keyed by (query, limit), so repeated searches skip arXiv for a while
+_PAPERS_CACHE: TTLCache[tuple[str, int], list[dict[str, Any]]] = TTLCache(maxsize=256, ttl=600)
+
 
 class ArxivToolInput(BaseModel):
     """Input schema for arXiv Tool."""
@@ -41,8 +64,9 @@ class ArxivTool(Tool[ArxivToolInput, ToolRunOptions, JSONToolOutput[dict[str, An
 
     # arXiv API configuration
     BASE_URL = "https://export.arxiv.org/api/query"
-    ATOM_NAMESPACE = "{http://www.w3.org/2005/Atom}"
-    ARXIV_NAMESPACE = "{http://arxiv.org/schemas/atom}"
+    ATOM_NAMESPACE = _ATOM
+    ARXIV_NAMESPACE = _ARXIV
+    STREAM_CHUNK_SIZE = 64 * 1024
 
     def _create_emitter(self) -> Emitter:
         """Creates event emitter for tool lifecycle events."""
@@ -92,74 +116,116 @@ class ArxivTool(Tool[ArxivToolInput, ToolRunOptions, JSONToolOutput[dict[str, An
         Returns:
             Dictionary containing paper details
         """
-        ns_atom = ArxivTool.ATOM_NAMESPACE
-        ns_arxiv = ArxivTool.ARXIV_NAMESPACE
-
-        # Extract basic fields
-        paper_id = entry.find(f"{ns_atom}id")
-        title = entry.find(f"{ns_atom}title")
-        summary = entry.find(f"{ns_atom}summary")
-        published = entry.find(f"{ns_atom}published")
-        updated = entry.find(f"{ns_atom}updated")
-
-        # Extract authors
+        # pylint: disable=too-many-branches
+        paper_id = title = summary = published = updated = ""
         authors = []
-        for author in entry.findall(f"{ns_atom}author"):
-            name = author.find(f"{ns_atom}name")
-            if name is not None and name.text:
-                authors.append(name.text.strip())
-
-        # Extract links (PDF and abstract)
         pdf_link = None
         abstract_link = None
-        for link in entry.findall(f"{ns_atom}link"):
-            if link.get("title") == "pdf":
-                pdf_link = link.get("href")
-            elif link.get("rel") == "alternate":
-                abstract_link = link.get("href")
-
-        # Extract categories
-        categories = []
-        primary_category = entry.find(f"{ns_arxiv}primary_category")
-        if primary_category is not None:
-            categories.append(primary_category.get("term", ""))
-
-        for category in entry.findall(f"{ns_atom}category"):
-            cat_term = category.get("term")
+        primary_category = None
+        category_terms = []
+
+        # Visit each child once, dispatching on its tag, instead of a find() per field
+        for child in entry:
+            tag = child.tag
+            if tag == _TAG_AUTHOR:
+                name = child.find(_TAG_NAME)
+                if name is not None and name.text:
+                    authors.append(name.text.strip())
+            elif tag == _TAG_LINK:
+                if child.get("title") == "pdf":
+                    pdf_link = child.get("href")
+                elif child.get("rel") == "alternate":
+                    abstract_link = child.get("href")
+            elif tag == _TAG_CATEGORY:
+                category_terms.append(child.get("term"))
+            elif tag == _TAG_ID:
+                paper_id = (child.text or "").strip()
+            elif tag == _TAG_TITLE:
+                title = (child.text or "").strip()
+            elif tag == _TAG_SUMMARY:
+                summary = (child.text or "").strip()
+            elif tag == _TAG_PUBLISHED:
+                # Atom timestamps are ISO 8601, so the date is their first 10 characters
+                published = (child.text or "")[:10]
+            elif tag == _TAG_UPDATED:
+                updated = (child.text or "")[:10]
+            elif tag == _TAG_PRIMARY_CATEGORY:
+                primary_category = child.get("term", "")
+
+        # Primary category first, then the remaining ones without duplicates
+        categories = [] if primary_category is None else [primary_category]
+        for cat_term in category_terms:
             if cat_term and cat_term not in categories:
                 categories.append(cat_term)
 
-        # Format dates
-        published_date = ""
-        updated_date = ""
-        if published is not None and published.text:
-            try:
-                published_date = datetime.fromisoformat(
-                    published.text.replace("Z", "+00:00")
-                ).strftime("%Y-%m-%d")
-            except (ValueError, AttributeError):
-                published_date = published.text[:10] if published.text else ""
-
-        if updated is not None and updated.text:
-            try:
-                updated_date = datetime.fromisoformat(updated.text.replace("Z", "+00:00")).strftime(
-                    "%Y-%m-%d"
-                )
-            except (ValueError, AttributeError):
-                updated_date = updated.text[:10] if updated.text else ""
-
         return {
-            "id": paper_id.text.strip() if paper_id is not None and paper_id.text else "",
-            "title": title.text.strip() if title is not None and title.text else "",
-            "abstract": summary.text.strip() if summary is not None and summary.text else "",
+            "id": paper_id,
+            "title": title,
+            "abstract": summary,
             "authors": authors,
-            "published": published_date,
-            "updated": updated_date,
+            "published": published,
+            "updated": updated,
             "pdf_link": pdf_link,
             "abstract_link": abstract_link,
             "categories": categories,
         }
 
+    @staticmethod
+    def _read_entries(parser: ET.XMLPullParser) -> list[dict[str, Any]]:
+        """
+        Parse the paper entries completed so far by a pull parser.
+
+        Args:
+            parser: XML pull parser fed with (part of) the arXiv response
+
+        Returns:
+            List of paper dictionaries, one per completed entry
+        """
+        papers = []
+
+        for _, elem in parser.read_events():
+            if elem.tag == _TAG_ENTRY:
+                papers.append(ArxivTool._parse_paper_entry(elem))
+                # Release the parsed entry, and with lxml also detach it and the earlier
+                # siblings from the root, so the tree stays flat as the response streams in.
+                # The stdlib fallback has no parent links and keeps the emptied elements.
+                elem.clear()
+                if hasattr(elem, "getprevious"):
+                    while elem.getprevious() is not None:
+                        del elem.getparent()[0]
+
+        return papers
+
+    @staticmethod
+    async def _stream_papers(
+        client: httpx.AsyncClient, params: dict[str, Any]
+    ) -> list[dict[str, Any]]:
+        """
+        Query the arXiv API and parse the papers while the response streams in.
+
+        Args:
+            client: HTTP client
+            params: arXiv API query parameters
+
+        Returns:
+            List of paper dictionaries
+        """
+        async with client.stream("GET", ArxivTool.BASE_URL, params=params) as response:
+            response.raise_for_status()
+
+            # Feed the XML parser as the body arrives instead of buffering it first
+            parser = ET.XMLPullParser(events=("end",))
+            papers = []
+
+            async for chunk in response.aiter_bytes(ArxivTool.STREAM_CHUNK_SIZE):
+                parser.feed(chunk)
+                papers.extend(ArxivTool._read_entries(parser))
+
+            parser.close()
+            papers.extend(ArxivTool._read_entries(parser))
+
+        return papers
+
     @staticmethod
     async def _fetch_papers(limit: int, query: str | None = None) -> dict[str, Any]:
         """
@@ -175,7 +241,10 @@ class ArxivTool(Tool[ArxivToolInput, ToolRunOptions, JSONToolOutput[dict[str, An
         Raises:
             ToolError: If API request fails
         """
-        proxy = os.environ.get("BEEAI_ARXIV_TOOL_PROXY")
+        # Normalize whitespace so equivalent queries share a cache entry. Case is kept
+        # as is, since arXiv boolean operators (AND, OR, ANDNOT) must be uppercase.
+        query = " ".join(query.split()) if query else None
+        cache_key = (query or "", limit)
 
         # Construct search query
         if query:
@@ -194,36 +263,26 @@ class ArxivTool(Tool[ArxivToolInput, ToolRunOptions, JSONToolOutput[dict[str, An
             "sortOrder": "descending",
         }
 
-        async with httpx.AsyncClient(proxy=proxy, timeout=30.0) as client:
-            try:
-                response = await client.get(ArxivTool.BASE_URL, params=params)
-                response.raise_for_status()
-
-                # Parse XML response
-                root = ET.fromstring(response.content)
-                ns_atom = ArxivTool.ATOM_NAMESPACE
-
-                # Extract paper entries
-                entries = root.findall(f"{ns_atom}entry")
-                papers = []
-
-                for entry in entries:
-                    paper = ArxivTool._parse_paper_entry(entry)
-                    papers.append(paper)
-
-                return {
-                    "papers": papers,
-                    "total_fetched": len(papers),
-                    "query": query if query else "recent cs.AI papers",
-                }
-
-            except httpx.HTTPStatusError as e:
-                raise ToolError(
-                    f"HTTP error fetching arXiv papers: {e.response.status_code}"
-                ) from e
-            except httpx.RequestError as e:
-                raise ToolError(f"Network error fetching arXiv papers: {str(e)}") from e
-            except ET.ParseError as e:
-                raise ToolError(f"Error parsing arXiv XML response: {str(e)}") from e
-            except Exception as e:
-                raise ToolError(f"Unexpected error fetching arXiv papers: {str(e)}") from e
+        # A plain client, as the disk cache reads whole responses and would defeat the streaming
+        client = get_client("arxiv", "BEEAI_ARXIV_TOOL_PROXY")
+
+        try:
+            papers = _PAPERS_CACHE.get(cache_key)
+            if papers is None:
+                papers = await ArxivTool._stream_papers(client, params)
+                _PAPERS_CACHE[cache_key] = papers
+
+            return {
+                "papers": papers,
+                "total_fetched": len(papers),
+                "query": query if query else "recent cs.AI papers",
+            }
+
+        except httpx.HTTPStatusError as e:
+            raise ToolError(f"HTTP error fetching arXiv papers: {e.response.status_code}") from e
+        except httpx.RequestError as e:
+            raise ToolError(f"Network error fetching arXiv papers: {str(e)}") from e
+        except ET.ParseError as e:
+            raise ToolError(f"Error parsing arXiv XML response: {str(e)}") from e
+        except Exception as e:
+            raise ToolError(f"Unexpected error fetching arXiv papers: {str(e)}") from e
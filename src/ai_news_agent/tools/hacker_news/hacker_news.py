@@ -1,16 +1,63 @@
 """Hacker News Tool for fetching AI/ML related stories."""
 
-import os
-from datetime import datetime
+import asyncio
+import re
+import time
 from typing import Any, Self
 
 import httpx
+import orjson
 from beeai_framework.context import RunContext
 from beeai_framework.emitter.emitter import Emitter
 from beeai_framework.tools import Tool, ToolError
 from beeai_framework.tools.types import JSONToolOutput, ToolRunOptions
+from cachetools import TTLCache
 from pydantic import BaseModel, Field
 
+from ai_news_agent.tools.http_client import get_client
+
+# The top stories ranking and story details change slowly, so repeated tool calls
+# within a few minutes are served from memory
+_TOP_STORIES_CACHE: TTLCache[str, list[int]] = TTLCache(maxsize=1, ttl=120)
+_STORY_CACHE: TTLCache[int, dict[str, Any]] = TTLCache(maxsize=4096, ttl=600)
+
+
+def _keywords_regex(keywords: list[str]) -> str:
+    """
+    Build a regex matching any of the keywords, factored into a prefix trie.
+
+    Keywords sharing a prefix share a single branch of the pattern (e.g.
+    "re(?:inforcement learning|trieval augmented)"), so the matcher walks each
+    prefix once instead of retrying every keyword at every position.
+
+    Args:
+        keywords: Keywords to match
+
+    Returns:
+        Regex source matching exactly the given (lowercased) keywords
+    """
+    trie: dict[str, dict] = {}
+    for keyword in keywords:
+        node = trie
+        for char in keyword.lower():
+            node = node.setdefault(char, {})
+        node[""] = {}  # End of keyword marker
+
+    def to_regex(node: dict[str, dict]) -> str:
+        branches = [
+            re.escape(char) + to_regex(child) for char, child in sorted(node.items()) if char
+        ]
+        if not branches:
+            return ""
+
+        pattern = branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+        if "" in node:
+            # A keyword ends here, the longer ones continuing from it are optional
+            return f"(?:{pattern})?"
+        return pattern
+
+    return to_regex(trie)
+
 
 class HackerNewsToolInput(BaseModel):
     """Input schema for Hacker News Tool."""
@@ -66,6 +113,13 @@ class HackerNewsTool(Tool[HackerNewsToolInput, ToolRunOptions, JSONToolOutput[di
         "retrieval augmented",
     ]
 
+    # All keywords compiled into a single case-insensitive trie-shaped pattern, matched
+    # on word boundaries (plurals allowed) so that e.g. "ai" does not match "said"
+    AI_KEYWORDS_PATTERN = re.compile(rf"\b{_keywords_regex(AI_KEYWORDS)}s?\b", re.IGNORECASE)
+
+    # Maximum number of item requests in flight at once
+    MAX_CONCURRENT_REQUESTS = 32
+
     def _create_emitter(self) -> Emitter:
         """Creates event emitter for tool lifecycle events."""
         return Emitter.root().child(
@@ -115,8 +169,33 @@ class HackerNewsTool(Tool[HackerNewsToolInput, ToolRunOptions, JSONToolOutput[di
         Returns:
             True if story contains AI/ML keywords
         """
-        content = f"{title} {text or ''}".lower()
-        return any(keyword in content for keyword in HackerNewsTool.AI_KEYWORDS)
+        # Titles are short and usually decisive, so only scan the text when they miss
+        if HackerNewsTool.AI_KEYWORDS_PATTERN.search(title):
+            return True
+        return bool(text) and HackerNewsTool.AI_KEYWORDS_PATTERN.search(text) is not None
+
+    @staticmethod
+    def _format_story(story: dict[str, Any]) -> dict[str, Any]:
+        """
+        Format a story for the tool output.
+
+        Args:
+            story: Story details as returned by the Hacker News API
+
+        Returns:
+            Formatted story with a readable UTC timestamp and a guaranteed URL
+        """
+        text = story.get("text")
+        return {
+            "id": story.get("id"),
+            "title": story.get("title", ""),
+            "url": story.get("url", f"https://news.ycombinator.com/item?id={story.get('id')}"),
+            "score": story.get("score", 0),
+            "author": story.get("by", "unknown"),
+            "time": time.strftime("%Y-%m-%d %H:%M:%S UTC", time.gmtime(story.get("time", 0))),
+            "text": text if text else None,
+            "comments_count": story.get("descendants", 0),
+        }
 
     @staticmethod
     async def _fetch_story_details(
@@ -132,15 +211,88 @@ class HackerNewsTool(Tool[HackerNewsToolInput, ToolRunOptions, JSONToolOutput[di
         Returns:
             Story details or None if fetch fails
         """
+        story = _STORY_CACHE.get(story_id)
+        if story is not None:
+            return story
+
         try:
             response = await client.get(
                 f"https://hacker-news.firebaseio.com/v0/item/{story_id}.json"
             )
             response.raise_for_status()
-            return response.json()
+            story = orjson.loads(response.content)
         except (httpx.HTTPStatusError, httpx.RequestError):
             return None
 
+        if story is not None:
+            _STORY_CACHE[story_id] = story
+        return story
+
+    @staticmethod
+    async def _collect_ai_stories(
+        client: httpx.AsyncClient, story_ids: list[int], limit: int
+    ) -> tuple[list[dict[str, Any]], int]:
+        """
+        Collect the first AI/ML related stories in ranking order.
+
+        Story details are fetched concurrently within a sliding window of
+        MAX_CONCURRENT_REQUESTS ranks starting at the first unchecked story, and
+        consumed in ranking order as they complete. A new fetch is only started
+        when the window advances, so once enough stories are found at most
+        MAX_CONCURRENT_REQUESTS - 1 fetches beyond the last checked story are
+        cancelled or wasted.
+
+        Args:
+            client: HTTP client
+            story_ids: Ranked story IDs to check
+            limit: Maximum number of stories to collect
+
+        Returns:
+            Formatted AI/ML stories and the number of stories checked
+        """
+
+        async def fetch_ranked(rank: int) -> tuple[int, dict[str, Any] | None]:
+            return rank, await HackerNewsTool._fetch_story_details(client, story_ids[rank])
+
+        pending: set[asyncio.Task[tuple[int, dict[str, Any] | None]]] = set()
+        completed: dict[int, dict[str, Any] | None] = {}
+        ai_stories: list[dict[str, Any]] = []
+        checked_count = 0
+        next_rank = 0
+
+        try:
+            while len(ai_stories) < limit and checked_count < len(story_ids):
+                # Keep the window of in-flight fetches anchored at the first unchecked story
+                window_end = min(
+                    checked_count + HackerNewsTool.MAX_CONCURRENT_REQUESTS, len(story_ids)
+                )
+                while next_rank < window_end:
+                    pending.add(asyncio.create_task(fetch_ranked(next_rank)))
+                    next_rank += 1
+
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    rank, story = task.result()
+                    completed[rank] = story
+
+                # Check completed stories in ranking order, up to the first pending one
+                while checked_count in completed and len(ai_stories) < limit:
+                    story = completed.pop(checked_count)
+                    checked_count += 1
+
+                    if (
+                        story
+                        and story.get("type") == "story"
+                        and HackerNewsTool._is_ai_related(story.get("title", ""), story.get("text"))
+                    ):
+                        ai_stories.append(HackerNewsTool._format_story(story))
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+        return ai_stories, checked_count
+
     @staticmethod
     async def _fetch_ai_stories(limit: int) -> dict[str, Any]:
         """
@@ -156,69 +308,36 @@ class HackerNewsTool(Tool[HackerNewsToolInput, ToolRunOptions, JSONToolOutput[di
             ToolError: If API request fails
         """
         base_url = "https://hacker-news.firebaseio.com/v0"
-        proxy = os.environ.get("BEEAI_HN_TOOL_PROXY")
 
-        async with httpx.AsyncClient(proxy=proxy, timeout=30.0) as client:
-            try:
-                # Fetch top story IDs
+        client = get_client("hacker_news", "BEEAI_HN_TOOL_PROXY")
+
+        try:
+            # Fetch top story IDs
+            story_ids = _TOP_STORIES_CACHE.get("top")
+            if story_ids is None:
                 response = await client.get(f"{base_url}/topstories.json")
                 response.raise_for_status()
-                story_ids = response.json()
-
-                # Fetch and filter stories
-                ai_stories = []
-                checked_count = 0
-                max_to_check = min(200, len(story_ids))  # Check up to 200 stories
+                story_ids = orjson.loads(response.content)[:200]  # Check up to 200 stories
+                _TOP_STORIES_CACHE["top"] = story_ids
 
-                for story_id in story_ids[:max_to_check]:
-                    if len(ai_stories) >= limit:
-                        break
+            ai_stories, checked_count = await HackerNewsTool._collect_ai_stories(
+                client, story_ids, limit
+            )
 
-                    checked_count += 1
-                    story = await HackerNewsTool._fetch_story_details(client, story_id)
-
-                    if not story or story.get("type") != "story":
-                        continue
-
-                    title = story.get("title", "")
-                    text = story.get("text", "")
-
-                    # Filter for AI/ML content
-                    if HackerNewsTool._is_ai_related(title, text):
-                        # Format timestamp
-                        timestamp = story.get("time", 0)
-                        formatted_time = datetime.fromtimestamp(timestamp).strftime(
-                            "%Y-%m-%d %H:%M:%S"
-                        )
-
-                        formatted_story = {
-                            "id": story.get("id"),
-                            "title": title,
-                            "url": story.get(
-                                "url", f"https://news.ycombinator.com/item?id={story_id}"
-                            ),
-                            "score": story.get("score", 0),
-                            "author": story.get("by", "unknown"),
-                            "time": formatted_time,
-                            "text": text if text else None,
-                            "comments_count": story.get("descendants", 0),
-                        }
-                        ai_stories.append(formatted_story)
-
-                # Sort by score (descending)
-                ai_stories.sort(key=lambda x: x["score"], reverse=True)
-
-                return {
-                    "stories": ai_stories,
-                    "total_fetched": len(ai_stories),
-                    "total_checked": checked_count,
-                }
-
-            except httpx.HTTPStatusError as e:
-                raise ToolError(
-                    f"HTTP error fetching Hacker News stories: {e.response.status_code}"
-                ) from e
-            except httpx.RequestError as e:
-                raise ToolError(f"Network error fetching Hacker News stories: {str(e)}") from e
-            except Exception as e:
-                raise ToolError(f"Unexpected error fetching Hacker News stories: {str(e)}") from e
+            # Sort by score (descending)
+            ai_stories.sort(key=lambda x: x["score"], reverse=True)
+
+            return {
+                "stories": ai_stories,
+                "total_fetched": len(ai_stories),
+                "total_checked": checked_count,
+            }
+
+        except httpx.HTTPStatusError as e:
+            raise ToolError(
+                f"HTTP error fetching Hacker News stories: {e.response.status_code}"
+            ) from e
+        except httpx.RequestError as e:
+            raise ToolError(f"Network error fetching Hacker News stories: {str(e)}") from e
+        except Exception as e:
+            raise ToolError(f"Unexpected error fetching Hacker News stories: {str(e)}") from e
@@ -0,0 +1,167 @@
+"""Shared HTTP clients for the news tools."""
+
+import asyncio
+import os
+import random
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from time import time
+
+import hishel
+import httpx
+
+# On-disk HTTP cache, one directory per tool, so cached responses survive restarts
+HTTP_CACHE_DIR = Path(".cache/http")
+
+# Long-lived clients keyed by tool name, so connections are pooled across tool calls
+_CLIENTS: dict[str, httpx.AsyncClient] = {}
+
+# Default timeout of the shared clients, in seconds, for every phase of a request
+DEFAULT_TIMEOUT = 30.0
+
+# Timeouts for clients of fast upstreams: fail fast on connecting and on waiting for a pooled
+# connection, while leaving the upstream time to answer
+HTTP_TIMEOUTS = httpx.Timeout(connect=3.0, read=15.0, write=5.0, pool=2.0)
+
+# Statuses meaning the upstream is throttling or briefly unavailable, so a later retry may succeed
+RETRY_STATUSES = frozenset({429, 502, 503, 504})
+
+
+def get_client(
+    name: str,
+    proxy_env: str,
+    *,
+    cache_ttl: float | None = None,
+    force_cache: bool = False,
+    timeout: httpx.Timeout | float = DEFAULT_TIMEOUT,
+) -> httpx.AsyncClient:
+    """
+    Get the shared HTTP client of a tool, creating it on first use.
+
+    Args:
+        name: Name of the tool the client belongs to
+        proxy_env: Environment variable holding the tool's optional proxy URL, read
+            once when the client is created (see refresh_client)
+        cache_ttl: If set, back the client with a disk cache keeping responses for
+            this many seconds. Freshness follows the response headers (falling back
+            to heuristics based on Last-Modified), and stale responses are served
+            when the upstream cannot be reached. Cached clients read each response
+            in full before returning it, so streaming through them saves nothing.
+        force_cache: Cache and reuse responses for the whole TTL regardless of their
+            headers, for endpoints that send no caching headers
+        timeout: Request timeout, either for every phase or split per phase (e.g.
+            HTTP_TIMEOUTS)
+
+    Returns:
+        Long-lived AsyncClient reusing pooled keep-alive connections, negotiating
+        HTTP/2 so concurrent requests to a host share a single connection
+    """
+    client = _CLIENTS.get(name)
+    if client is None or client.is_closed:
+        client = _create_client(name, os.environ.get(proxy_env), cache_ttl, force_cache, timeout)
+        _CLIENTS[name] = client
+
+    return client
+
+
+def _create_client(
+    name: str,
+    proxy: str | None,
+    cache_ttl: float | None,
+    force_cache: bool,
+    timeout: httpx.Timeout | float,
+) -> httpx.AsyncClient:
+    """Create a pooled HTTP client, optionally backed by the on-disk cache."""
+    options: dict = {
+        "proxy": proxy,
+        "http2": True,
+        "timeout": timeout,
+        "limits": httpx.Limits(max_connections=64, max_keepalive_connections=32),
+    }
+
+    if cache_ttl is None:
+        return httpx.AsyncClient(**options)
+
+    return hishel.AsyncCacheClient(
+        storage=hishel.AsyncFileStorage(base_path=HTTP_CACHE_DIR / name, ttl=cache_ttl),
+        controller=hishel.Controller(
+            allow_heuristics=True, allow_stale=True, force_cache=force_cache
+        ),
+        **options,
+    )
+
+
+async def refresh_client(name: str) -> None:
+    """
+    Close the shared HTTP client of a tool, so the next get_client creates a new one.
+
+    Use it after changing the tool's proxy environment variable, e.g. in tests.
+
+    Args:
+        name: Name of the tool the client belongs to
+    """
+    client = _CLIENTS.pop(name, None)
+    if client is not None:
+        await client.aclose()
+
+
+async def close_clients() -> None:
+    """Close all shared HTTP clients."""
+    clients = list(_CLIENTS.values())
+    _CLIENTS.clear()
+
+    for client in clients:
+        await client.aclose()
+
+
+async def get_with_retries(
+    client: httpx.AsyncClient,
+    url: str,
+    *,
+    retries: int = 3,
+    backoff: float = 0.5,
+    max_delay: float = 10.0,
+    **kwargs,
+) -> httpx.Response:
+    """
+    Send a GET request, retrying throttled and unavailable responses.
+
+    Args:
+        client: HTTP client to send the request with
+        url: URL to request
+        retries: Maximum number of retries after the first attempt
+        backoff: Base delay in seconds, doubled on every retry and jittered
+        max_delay: Upper bound in seconds of a single delay, including Retry-After
+        **kwargs: Extra arguments for AsyncClient.get
+
+    Returns:
+        The first response not in RETRY_STATUSES, or the last one once retries run out
+    """
+    for attempt in range(retries + 1):
+        response = await client.get(url, **kwargs)
+        if response.status_code not in RETRY_STATUSES or attempt == retries:
+            break
+
+        delay = _retry_after(response)
+        if delay is None:
+            delay = random.uniform(0, backoff * 2**attempt)
+        await asyncio.sleep(min(delay, max_delay))
+
+    return response
+
+
+def _retry_after(response: httpx.Response) -> float | None:
+    """Seconds to wait according to the Retry-After header (delay or HTTP date), if any."""
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time(), 0.0)
+    except (TypeError, ValueError):
+        return None
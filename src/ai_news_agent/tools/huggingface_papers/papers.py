@@ -1,15 +1,46 @@
 """Tool for fetching trending AI/ML research papers from Hugging Face Hub."""
 
-import os
+from types import MappingProxyType
 from typing import Any, Self
 
 import httpx
+import orjson
 from beeai_framework.context import RunContext
 from beeai_framework.emitter.emitter import Emitter
 from beeai_framework.tools import Tool, ToolError
 from beeai_framework.tools.types import JSONToolOutput, ToolRunOptions
+from cachetools import TTLCache
 from pydantic import BaseModel, Field
 
+from ai_news_agent.tools.http_client import get_client
+
+# Daily papers change a few times a day, so repeated tool calls are served from memory
+_DAILY_PAPERS_CACHE: TTLCache[str, list[dict[str, Any]]] = TTLCache(maxsize=1, ttl=300)
+
+# Shared read-only stand-in for items without paper details
+_EMPTY_PAPER = MappingProxyType({})
+
+
+def _format_paper(item: dict[str, Any]) -> dict[str, Any]:
+    """Format a daily papers item into the tool's paper representation"""
+    paper = item.get("paper") or _EMPTY_PAPER
+    paper_id = paper.get("id")
+    return {
+        "id": paper_id,
+        "title": paper.get("title"),
+        "summary": paper.get("ai_summary"),
+        "keywords": paper.get("ai_keywords", []),
+        "authors": [
+            author.get("name") for author in paper.get("authors") or () if not author.get("hidden")
+        ],
+        "publishedAt": item.get("publishedAt"),
+        "upvotes": paper.get("upvotes", 0),
+        "numComments": item.get("numComments", 0),
+        "githubRepo": paper.get("githubRepo"),
+        "githubStars": paper.get("githubStars"),
+        "url": f"https://huggingface.co/papers/{paper_id}" if paper_id else None,
+    }
+
 
 class HuggingFacePapersToolInput(BaseModel):
     """Input schema for HuggingFace Papers Tool."""
@@ -42,52 +73,29 @@ class HuggingFacePapersTool(
         """Fetch papers from Hugging Face API"""
         url = "https://huggingface.co/api/daily_papers"
 
-        async with httpx.AsyncClient(
-            proxy=os.environ.get("BEEAI_HF_PAPERS_TOOL_PROXY"), timeout=30.0
-        ) as client:
-            try:
+        client = get_client(
+            "huggingface_papers", "BEEAI_HF_PAPERS_TOOL_PROXY", cache_ttl=900, force_cache=True
+        )
+
+        try:
+            papers_data = _DAILY_PAPERS_CACHE.get(url)
+            if papers_data is None:
                 response = await client.get(url, headers={"Accept": "application/json"})
                 response.raise_for_status()
-                papers_data = response.json()
-
-                # Limit results
-                papers_data = papers_data[:limit]
-
-                # Format the response
-                formatted_papers = []
-                for item in papers_data:
-                    paper = item.get("paper", {})
-                    formatted_paper = {
-                        "id": paper.get("id"),
-                        "title": paper.get("title"),
-                        "summary": paper.get("ai_summary"),
-                        "keywords": paper.get("ai_keywords", []),
-                        "authors": [
-                            author.get("name")
-                            for author in paper.get("authors", [])
-                            if not author.get("hidden", False)
-                        ],
-                        "publishedAt": item.get("publishedAt"),
-                        "upvotes": paper.get("upvotes", 0),
-                        "numComments": item.get("numComments", 0),
-                        "githubRepo": paper.get("githubRepo"),
-                        "githubStars": paper.get("githubStars"),
-                        "url": (
-                            f"https://huggingface.co/papers/{paper.get('id')}"
-                            if paper.get("id")
-                            else None
-                        ),
-                    }
-                    formatted_papers.append(formatted_paper)
-
-                return {"papers": formatted_papers, "total_fetched": len(formatted_papers)}
-
-            except httpx.HTTPStatusError as e:
-                raise ToolError(f"HTTP error fetching papers: {e.response.status_code}") from e
-            except httpx.RequestError as e:
-                raise ToolError(f"Network error fetching papers: {str(e)}") from e
-            except Exception as e:
-                raise ToolError(f"Unexpected error fetching papers: {str(e)}") from e
+                papers_data = orjson.loads(response.content)
+                _DAILY_PAPERS_CACHE[url] = papers_data
+
+            # Format the response, limiting results
+            formatted_papers = [_format_paper(item) for item in papers_data[:limit]]
+
+            return {"papers": formatted_papers, "total_fetched": len(formatted_papers)}
+
+        except httpx.HTTPStatusError as e:
+            raise ToolError(f"HTTP error fetching papers: {e.response.status_code}") from e
+        except httpx.RequestError as e:
+            raise ToolError(f"Network error fetching papers: {str(e)}") from e
+        except Exception as e:
+            raise ToolError(f"Unexpected error fetching papers: {str(e)}") from e
 
     async def _run(  # pylint: disable=arguments-renamed
         self,
@@ -1,21 +1,79 @@
 """Tool for fetching trending Spaces from Hugging Face Hub."""
 
-import os
+import asyncio
+import logging
+import time
 from typing import Any, Self
 
 import httpx
+import msgspec
+from beeai_framework.cache import SlidingCache
 from beeai_framework.context import RunContext
 from beeai_framework.emitter.emitter import Emitter
 from beeai_framework.tools import Tool, ToolError
 from beeai_framework.tools.types import JSONToolOutput, ToolRunOptions
 from pydantic import BaseModel, Field
 
+from ai_news_agent.tools.http_client import HTTP_TIMEOUTS, get_client, get_with_retries
+
+logger = logging.getLogger(__name__)
+
+# Trending spaces sorted by trending score, with the time they were fetched, their ETag and
+# the request currently fetching them. Lists older than SPACES_TTL are still served while a
+# background task revalidates them.
+_SPACES_CACHE: dict[str, Any] = {
+    "spaces": None,
+    "fetched_at": float("-inf"),
+    "etag": None,
+    "request": None,
+}
+_REFRESH_TASKS: set[asyncio.Task] = set()
+
+# Spaces are linked by appending their id to this prefix
+_SPACE_URL_PREFIX = "https://huggingface.co/spaces/"
+
+# Upper bound of the tool's limit input, and so the number of spaces worth keeping
+_MAX_SPACES = 100
+
+# Tool outputs keyed by input, so identical calls skip fetching and formatting altogether.
+# Entries expire 5 minutes after being stored and are dropped whenever a new list arrives.
+_OUTPUT_CACHE: SlidingCache[JSONToolOutput[dict[str, Any]]] = SlidingCache(size=128, ttl=300)
+
+
+class Space(msgspec.Struct):  # pylint: disable=too-few-public-methods
+    """Hugging Face Space fields used by the tool; other fields are skipped when decoding."""
+
+    id: str | None = None
+    sdk: str | None = None
+    likes: int | None = 0
+    trendingScore: int | float | None = 0  # pylint: disable=invalid-name
+    tags: list[str] | None = []
+    private: bool | None = False
+    createdAt: str | None = None  # pylint: disable=invalid-name
+
+
+class SpaceOut(Space):  # pylint: disable=too-few-public-methods
+    """Space as returned by the tool, encoded to JSON by msgspec without building a dict."""
+
+    url: str | None = None
+
+    def to_json_safe(self) -> dict[str, Any]:
+        """Plain dict form, for the framework's own JSON helpers"""
+        return msgspec.structs.asdict(self)
+
+
+class SpacesToolOutput(JSONToolOutput[dict[str, Any]]):
+    """Tool output whose text is encoded by msgspec, which serializes SpaceOut natively."""
+
+    def get_text_content(self) -> str:
+        return msgspec.json.encode(self.result).decode()
+
 
 class HuggingFaceSpacesToolInput(BaseModel):
     """Input schema for HuggingFace Spaces Tool."""
 
     limit: int = Field(
-        description="Maximum number of trending spaces to fetch", default=10, ge=1, le=100
+        description="Maximum number of trending spaces to fetch", default=10, ge=1, le=_MAX_SPACES
     )
 
 
@@ -32,6 +90,26 @@ class HuggingFaceSpacesTool(
     )
     input_schema = HuggingFaceSpacesToolInput
 
+    # Hugging Face API configuration
+    BASE_URL = "https://huggingface.co/api/spaces"
+    # Let the Hub rank the spaces and send only as many as a call can ask for
+    QUERY_PARAMS = {"sort": "trendingScore", "direction": -1, "limit": _MAX_SPACES}
+    SPACES_TTL = 300.0
+    SPACES_MAX_STALE = 3600.0
+
+    def __init__(self, options: dict[str, Any] | None = None) -> None:
+        # Tool.run serves repeated inputs from the tool cache; default to one shared by all
+        # instances, so a new spaces list invalidates the outputs of every one of them
+        super().__init__({"cache": _OUTPUT_CACHE, **(options or {})})
+
+        # When created inside the event loop, prefetch the spaces list so the first call
+        # finds both an open connection and a warm cache
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        HuggingFaceSpacesTool._refresh_in_background()
+
     def _create_emitter(self) -> Emitter:
         """Creates event emitter for tool lifecycle events"""
         return Emitter.root().child(
@@ -39,52 +117,124 @@ class HuggingFaceSpacesTool(
             creator=self,
         )
 
+    @staticmethod
+    async def _load_spaces(client: httpx.AsyncClient) -> list[Space]:
+        """
+        Get the trending spaces list, fetching it unless the cached one is fresh.
+
+        Concurrent callers share a single in-flight request, and all of them get its
+        result or its error.
+
+        Args:
+            client: HTTP client
+
+        Returns:
+            Top trending spaces, sorted by trending score (descending)
+        """
+        if time.monotonic() - _SPACES_CACHE["fetched_at"] < HuggingFaceSpacesTool.SPACES_TTL:
+            return _SPACES_CACHE["spaces"]
+
+        request = _SPACES_CACHE["request"]
+        if request is None:
+            request = asyncio.create_task(HuggingFaceSpacesTool._request_spaces(client))
+            request.add_done_callback(lambda _: _SPACES_CACHE.update(request=None))
+            _SPACES_CACHE["request"] = request
+
+        # A cancelled caller must not cancel the request the others are waiting on
+        return await asyncio.shield(request)
+
+    @staticmethod
+    async def _request_spaces(client: httpx.AsyncClient) -> list[Space]:
+        """
+        Fetch the trending spaces list into the cache, revalidating it with its ETag.
+
+        Args:
+            client: HTTP client
+
+        Returns:
+            Top trending spaces, sorted by trending score (descending)
+        """
+        headers = {"Accept": "application/json"}
+        if _SPACES_CACHE["spaces"] is not None and _SPACES_CACHE["etag"]:
+            headers["If-None-Match"] = _SPACES_CACHE["etag"]
+
+        response = await get_with_retries(
+            client,
+            HuggingFaceSpacesTool.BASE_URL,
+            params=HuggingFaceSpacesTool.QUERY_PARAMS,
+            headers=headers,
+        )
+
+        # Not modified: keep the cached list for another TTL
+        if response.status_code != httpx.codes.NOT_MODIFIED:
+            response.raise_for_status()
+            _SPACES_CACHE["spaces"] = msgspec.json.decode(response.content, type=list[Space])
+            _SPACES_CACHE["etag"] = response.headers.get("ETag")
+
+            # Outputs built from the previous list are outdated now
+            await _OUTPUT_CACHE.clear()
+
+        _SPACES_CACHE["fetched_at"] = time.monotonic()
+        return _SPACES_CACHE["spaces"]
+
+    @staticmethod
+    async def _revalidate_spaces(client: httpx.AsyncClient) -> None:
+        """Refresh the cached spaces list, keeping the stale copy if the refresh fails."""
+        try:
+            await HuggingFaceSpacesTool._load_spaces(client)
+        except (httpx.HTTPError, msgspec.DecodeError) as e:
+            logger.warning("Background refresh of Hugging Face spaces failed: %s", e)
+
+    @staticmethod
+    def _refresh_in_background() -> None:
+        """Refresh the cached spaces list in a background task."""
+        client = get_client(
+            "huggingface_spaces", "BEEAI_HF_SPACES_TOOL_PROXY", timeout=HTTP_TIMEOUTS
+        )
+        task = asyncio.create_task(HuggingFaceSpacesTool._revalidate_spaces(client))
+        _REFRESH_TASKS.add(task)
+        task.add_done_callback(_REFRESH_TASKS.discard)
+
     @staticmethod
     async def _fetch_spaces(limit: int) -> dict[str, Any]:
         """Fetch trending spaces from Hugging Face API"""
-        url = "https://huggingface.co/api/spaces"
+        client = get_client(
+            "huggingface_spaces", "BEEAI_HF_SPACES_TOOL_PROXY", timeout=HTTP_TIMEOUTS
+        )
 
-        async with httpx.AsyncClient(
-            proxy=os.environ.get("BEEAI_HF_SPACES_TOOL_PROXY"), timeout=30.0
-        ) as client:
-            try:
-                response = await client.get(url, headers={"Accept": "application/json"})
-                response.raise_for_status()
-                spaces_data = response.json()
-
-                # Sort by trending score (descending)
-                spaces_data.sort(key=lambda x: x.get("trendingScore", 0), reverse=True)
-
-                # Limit results
-                spaces_data = spaces_data[:limit]
-
-                # Format the response
-                formatted_spaces = []
-                for space in spaces_data:
-                    formatted_space = {
-                        "id": space.get("id"),
-                        "sdk": space.get("sdk"),
-                        "likes": space.get("likes", 0),
-                        "trendingScore": space.get("trendingScore", 0),
-                        "tags": space.get("tags", []),
-                        "private": space.get("private", False),
-                        "createdAt": space.get("createdAt"),
-                        "url": (
-                            f"https://huggingface.co/spaces/{space.get('id')}"
-                            if space.get("id")
-                            else None
-                        ),
-                    }
-                    formatted_spaces.append(formatted_space)
-
-                return {"spaces": formatted_spaces, "total_fetched": len(formatted_spaces)}
+        spaces_data = _SPACES_CACHE["spaces"]
+        age = time.monotonic() - _SPACES_CACHE["fetched_at"]
 
+        if spaces_data is None or age >= HuggingFaceSpacesTool.SPACES_MAX_STALE:
+            # Only fetching the list can fail on the upstream's account
+            try:
+                spaces_data = await HuggingFaceSpacesTool._load_spaces(client)
             except httpx.HTTPStatusError as e:
                 raise ToolError(f"HTTP error fetching spaces: {e.response.status_code}") from e
             except httpx.RequestError as e:
                 raise ToolError(f"Network error fetching spaces: {str(e)}") from e
-            except Exception as e:
-                raise ToolError(f"Unexpected error fetching spaces: {str(e)}") from e
+            except msgspec.DecodeError as e:
+                raise ToolError(f"Error decoding spaces response: {str(e)}") from e
+        elif age >= HuggingFaceSpacesTool.SPACES_TTL and _SPACES_CACHE["request"] is None:
+            # Serve the stale list right away and refresh it in the background
+            HuggingFaceSpacesTool._refresh_in_background()
+
+        # Format the response, limiting results
+        formatted_spaces = [
+            SpaceOut(
+                id=space.id,
+                sdk=space.sdk,
+                likes=space.likes,
+                trendingScore=space.trendingScore,
+                tags=space.tags,
+                private=space.private,
+                createdAt=space.createdAt,
+                url=_SPACE_URL_PREFIX + space.id if space.id else None,
+            )
+            for space in spaces_data[:limit]
+        ]
+
+        return {"spaces": formatted_spaces, "total_fetched": len(formatted_spaces)}
 
     async def _run(  # pylint: disable=arguments-renamed
         self,
@@ -94,7 +244,7 @@ class HuggingFaceSpacesTool(
     ) -> JSONToolOutput[dict[str, Any]]:
         """Main execution method for the tool"""
         results = await self._fetch_spaces(input_data.limit)
-        return JSONToolOutput(results)
+        return SpacesToolOutput(results)
 
     async def clone(self) -> Self:
         """Creates a copy of the tool instance"""
@@ -103,5 +253,7 @@ class HuggingFaceSpacesTool(
         tool.description = self.description
         tool.input_schema = self.input_schema
         tool.middlewares.extend(self.middlewares)
-        tool._cache = await self.cache.clone()  # pylint: disable=protected-access
+        # Keep sharing the default output cache, so clones see its invalidation too
+        if self.cache is not _OUTPUT_CACHE:
+            tool._cache = await self.cache.clone()  # pylint: disable=protected-access
         return tool